@@ -3,27 +3,287 @@ AI services for the Blender Ideation Agent.
 Handles integration with Claude 3.7 and other AI models.
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import hashlib
 import json
 import os
-import re
-from typing import Dict, List, Optional, Tuple
+import shutil
+import string
+import threading
+import time
+import uuid
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+)
+
+# numpy, anthropic and PIL are imported where they are used, so importing
+# this module (e.g. for the mock generators) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    from anthropic import AsyncAnthropic
+    from PIL import Image
+
+# Abort a streamed response if no chunk arrives within this many seconds
+STREAM_IDLE_TIMEOUT = 30.0
+
+# Report streaming progress every this many chunks
+STREAM_PROGRESS_INTERVAL = 5
+
+# Seconds between status checks while waiting for a message batch
+BATCH_POLL_INTERVAL = 60.0
+
+# Minimum cosine similarity for a semantic cache hit
+SEMANTIC_CACHE_THRESHOLD = 0.9
+
+# Translation table deleting the ASCII characters not allowed in generated
+# model filenames (anything but lowercase letters, digits, "_" and "-")
+_FILENAME_KEEP = set(string.ascii_lowercase + string.digits + "_-")
+_FILENAME_DELETE_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c) not in _FILENAME_KEEP)
+)
+
+# Fixed prompt text, identical across sessions. These are sent as cacheable
+# prefix blocks so repeated calls can reuse Anthropic's prompt cache; only
+# the project fields that follow them vary per request.
+_TAGS_SYSTEM_PROMPT = "You extract relevant keywords as tags from text."
+_SUGGESTIONS_SYSTEM_PROMPT = "You provide helpful suggestions for 3D design projects."
+_TAGS_INSTRUCTIONS = "Extract relevant tags from the project description below."
+_3D_PROMPT_INSTRUCTIONS = (
+    "Create a detailed 3D model description for the project below.\n\n"
+    "Provide specific details about shape, texture, color, and proportions "
+    "that would help a 3D modeling system create an appropriate model.\n"
+    "Include details about materials, lighting, and environment if relevant."
+)
+_SUMMARY_INSTRUCTIONS = (
+    "Create a concise summary (2-3 sentences) for the Blender project below."
+)
+_SUGGESTIONS_INSTRUCTIONS = (
+    "Suggest 3-5 specific improvements or additions for the Blender project below."
+)
+
+# Tools that force JSON-returning methods to answer with schema-valid input
+# instead of free text
+_TAGS_TOOL = {
+    "name": "return_tags",
+    "description": "Return the extracted tags.",
+    "input_schema": {
+        "type": "object",
+        "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+        "required": ["tags"],
+    },
+}
+_SUGGESTIONS_TOOL = {
+    "name": "return_suggestions",
+    "description": "Return the improvement suggestions, one specific suggestion per item.",
+    "input_schema": {
+        "type": "object",
+        "properties": {"suggestions": {"type": "array", "items": {"type": "string"}}},
+        "required": ["suggestions"],
+    },
+}
+
+
+def _cached_block(text: str) -> Dict:
+    """Build a text content block marked as a prompt-cache breakpoint."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
 
-import numpy as np
-from anthropic import Anthropic
-from PIL import Image
+def _user_message(instructions: str, details: str) -> Dict:
+    """Build a user message with cached instructions followed by per-request details."""
+    return {
+        "role": "user",
+        "content": [_cached_block(instructions), {"type": "text", "text": details}],
+    }
 
-from blender_ideation.utils import add_color_tint
+
+def _message_result(message) -> Any:
+    """
+    Get a message's tool input if it called a tool, otherwise its text.
+    
+    Raises:
+        RuntimeError: If a tool call was cut off by max_tokens (its input
+            would be partially parsed JSON, e.g. a silently shortened list)
+    """
+    for block in message.content:
+        if block.type == "tool_use":
+            if message.stop_reason == "max_tokens":
+                raise RuntimeError(f"Tool call {block.name} was cut off by max_tokens")
+            return block.input
+    return "".join(block.text for block in message.content if block.type == "text")
+
+
+def _session_fields(session_data: Dict) -> Tuple[str, str, str, str]:
+    """Get the (concept, project type, genre, description) of a session dictionary."""
+    return (
+        session_data.get("title", "Unknown"),
+        session_data.get("project_type", "Unknown"),
+        session_data.get("genre", "Unknown"),
+        session_data.get("description", ""),
+    )
+
+
+def _format_project(concept: str, project_type: str, genre: str, description: str) -> str:
+    """Format the project fields shared by the project-level prompts."""
+    return (
+        f"- Concept: {concept}\n"
+        f"- Project Type: {project_type}\n"
+        f"- Genre: {genre}\n"
+        f"- Description: {description}"
+    )
+
+
+class SemanticCache:
+    """
+    Near-duplicate response cache backed by sentence embeddings.
+    Requires the optional sentence-transformers package; without it, lookups
+    always miss and nothing is stored.
+    """
+    
+    def __init__(
+        self, 
+        cache_dir: str, 
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2", 
+        threshold: float = SEMANTIC_CACHE_THRESHOLD
+    ):
+        """
+        Initialize the semantic cache.
+        
+        Args:
+            cache_dir: Directory to store embeddings and responses in
+            model_name: Sentence-transformers model used to embed inputs
+            threshold: Minimum cosine similarity for a cache hit
+        """
+        self.cache_dir = cache_dir
+        self.model_name = model_name
+        self.threshold = threshold
+        
+        # The encoder is loaded on first use; False marks it as unavailable
+        self._encoder = None
+        # namespace -> (normalized float32 embeddings, responses)
+        self._stores: Dict[str, Tuple[np.ndarray, List[Any]]] = {}
+        self._lock = threading.Lock()
+        self._encoder_lock = threading.Lock()
+    
+    def _get_encoder(self):
+        """Load the embedding model, or return None if it is unavailable."""
+        with self._encoder_lock:
+            if self._encoder is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    self._encoder = SentenceTransformer(self.model_name)
+                except Exception as e:
+                    print(f"Semantic cache disabled: {e}")
+                    self._encoder = False
+        return self._encoder or None
+    
+    def _paths(self, namespace: str) -> Tuple[str, str]:
+        """Get the embeddings and responses file paths for a namespace."""
+        base = os.path.join(self.cache_dir, f"semantic_{namespace}")
+        return f"{base}.npy", f"{base}.json"
+    
+    def _load(self, namespace: str) -> Tuple[np.ndarray, List[Any]]:
+        """Load a namespace's store from disk (must hold the lock)."""
+        import numpy as np
+        
+        if namespace not in self._stores:
+            embeddings_path, responses_path = self._paths(namespace)
+            try:
+                embeddings = np.load(embeddings_path)
+                with open(responses_path, 'r') as f:
+                    responses = json.load(f)
+            except (OSError, ValueError):
+                embeddings, responses = None, []
+            
+            if embeddings is None or len(embeddings) != len(responses):
+                embeddings, responses = np.empty((0, 0), dtype=np.float32), []
+            self._stores[namespace] = (embeddings, responses)
+        return self._stores[namespace]
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text as a unit-length float32 vector."""
+        import numpy as np
+        
+        encoder = self._get_encoder()
+        if encoder is None:
+            return None
+        return encoder.encode(text, normalize_embeddings=True).astype(np.float32)
+    
+    def lookup(self, namespace: str, text: str) -> Optional[Any]:
+        """
+        Find a stored response whose input is similar enough to text.
+        
+        Args:
+            namespace: Partition of the cache (e.g. method and model)
+            text: Input text to match
+            
+        Returns:
+            The most similar stored response, or None on a miss
+        """
+        query = self._embed(text)
+        if query is None:
+            return None
+        
+        with self._lock:
+            embeddings, responses = self._load(namespace)
+            if not responses:
+                return None
+            # Embeddings are unit length, so the dot product is the cosine similarity
+            similarities = embeddings @ query
+            best = int(similarities.argmax())
+            if similarities[best] >= self.threshold:
+                return responses[best]
+        return None
+    
+    def add(self, namespace: str, text: str, response: Any):
+        """
+        Store a response for an input text.
+        
+        Args:
+            namespace: Partition of the cache (e.g. method and model)
+            text: Input text
+            response: JSON-serializable response
+        """
+        import numpy as np
+        
+        vector = self._embed(text)
+        if vector is None:
+            return
+        
+        with self._lock:
+            embeddings, responses = self._load(namespace)
+            if len(responses):
+                embeddings = np.vstack([embeddings, vector])
+            else:
+                embeddings = vector[np.newaxis, :]
+            responses = responses + [response]
+            self._stores[namespace] = (embeddings, responses)
+            
+            embeddings_path, responses_path = self._paths(namespace)
+            try:
+                with open(f"{embeddings_path}.tmp", 'wb') as f:
+                    np.save(f, embeddings)
+                with open(f"{responses_path}.tmp", 'w') as f:
+                    json.dump(responses, f)
+                os.replace(f"{embeddings_path}.tmp", embeddings_path)
+                os.replace(f"{responses_path}.tmp", responses_path)
+            except OSError as e:
+                print(f"Error saving semantic cache {namespace}: {e}")
 
 
 class ClaudeService:
     """Integration with Anthropic's Claude 3.7 API."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None):
         """
         Initialize the Claude service.
         
         Args:
             api_key: Anthropic API key (will use environment variable if not provided)
+            cache_dir: Directory for cached responses (caching is disabled if not provided)
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -32,56 +292,269 @@ class ClaudeService:
                 "set the ANTHROPIC_API_KEY environment variable."
             )
         
-        # Initialize the Anthropic client
+        # Initialize the Anthropic client (sync for one-off calls). Async
+        # clients, which let independent requests be awaited concurrently,
+        # only live as long as a connect() block; see connect().
+        from anthropic import Anthropic
+        
         self.client = Anthropic(api_key=self.api_key)
+        self._aclient: contextvars.ContextVar[Optional[AsyncAnthropic]] = contextvars.ContextVar(
+            f"aclient_{id(self)}", default=None
+        )
         
         # Default model, can be overridden in method calls
         self.default_model = "claude-3-7-sonnet-20250219"  # Changed to correct model name
+        
+        # Faster, cheaper model for short tasks (tags, summaries, suggestions)
+        self.fast_model = "claude-haiku-4-5"
+        
+        # Responses are pure functions of the request, so identical requests
+        # can be answered from disk, and near-identical ones from the
+        # semantic cache where a method opts in
+        self.cache_dir = cache_dir
+        self.semantic_cache = SemanticCache(cache_dir) if cache_dir else None
     
-    def extract_tags(self, text_input: str, max_tags: int = 10) -> List[str]:
+    @contextlib.asynccontextmanager
+    async def connect(self):
         """
-        Extract relevant tags from user input using Claude.
+        Share one async client between the requests made inside this block
+        (including tasks it gathers), and close it and its connections on exit.
+        An async client's connection pool is tied to the event loop it runs
+        on, and callers such as the Streamlit app run each handler in a fresh
+        loop, so clients must not outlive the handler. Requests made outside
+        a connect() block open a client of their own.
+        """
+        from anthropic import AsyncAnthropic
+        
+        async with AsyncAnthropic(api_key=self.api_key) as client:
+            token = self._aclient.set(client)
+            try:
+                yield
+            finally:
+                self._aclient.reset(token)
+    
+    async def _cached(
+        self, 
+        method_name: str, 
+        params: Dict, 
+        fn: Callable[[], Awaitable[Any]], 
+        semantic_text: Optional[str] = None, 
+        semantic_scope: str = ""
+    ) -> Any:
+        """
+        Return a cached result for an exact-match request, calling fn on a miss.
         
         Args:
-            text_input: Text to extract tags from
-            max_tags: Maximum number of tags to extract
+            method_name: Name of the calling method (part of the cache key)
+            params: Full request parameters, including model and max_tokens
+            fn: Coroutine function producing a JSON-serializable result
+            semantic_text: Input text to match against similar earlier requests
+                when there is no exact match (semantic caching is skipped if None)
+            semantic_scope: Non-textual inputs that must match exactly for a
+                semantic hit (e.g. requested item counts)
             
         Returns:
-            List of extracted tags
+            Cached or freshly computed result
+        """
+        if not self.cache_dir:
+            return await fn()
+        
+        cache_path = self._cache_path(method_name, params)
+        result = self._read_cache(cache_path)
+        if result is not None:
+            return result
+        
+        if semantic_text is not None and self.semantic_cache:
+            namespace = hashlib.sha256(json.dumps({
+                "method": method_name,
+                "model": params["model"],
+                "max_tokens": params["max_tokens"],
+                "system": params.get("system"),
+                "tools": params.get("tools"),
+                "scope": semantic_scope,
+            }, sort_keys=True).encode()).hexdigest()[:16]
+            # Embedding is CPU-bound, so keep it off the event loop
+            result = await asyncio.to_thread(
+                self.semantic_cache.lookup, namespace, semantic_text
+            )
+            if result is None:
+                result = await fn()
+                await asyncio.to_thread(
+                    self.semantic_cache.add, namespace, semantic_text, result
+                )
+        else:
+            result = await fn()
+        
+        self._write_cache(cache_path, result)
+        return result
+    
+    def _cache_path(self, method_name: str, params: Dict) -> str:
+        """Get the exact-match cache file for a request."""
+        key = hashlib.sha256(
+            json.dumps({"method": method_name, "params": params}, sort_keys=True).encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _read_cache(self, cache_path: str) -> Optional[Any]:
+        """Read a cached response, or return None if there is none."""
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error reading cached response {cache_path}: {e}")
+        return None
+    
+    def _write_cache(self, cache_path: str, result: Any):
+        """Store a response in the exact-match cache."""
+        try:
+            # Write to a temporary file first so concurrent readers never see
+            # a partially written entry
+            tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Error caching response to {cache_path}: {e}")
+    
+    async def _stream_response(
+        self, 
+        on_progress: Optional[Callable[[int], None]] = None, 
+        **params
+    ) -> Any:
         """
-        prompt = f"""
-        Extract up to {max_tags} relevant tags from this project description.
-        Return only the tags as a JSON array of strings.
+        Stream a message from Claude and return its result.
         
-        Description: {text_input}
+        Args:
+            on_progress: Optional callback receiving the number of chunks received so far
+            **params: Parameters passed through to messages.stream()
+            
+        Returns:
+            The tool input if the request forces a tool call, otherwise the response text
+            
+        Raises:
+            TimeoutError: If no chunk arrives within STREAM_IDLE_TIMEOUT seconds
         """
+        client = self._aclient.get()
+        if client is None:
+            async with self.connect():
+                return await self._stream_response(on_progress, **params)
         
-        response = self.client.messages.create(
-            model=self.default_model,
-            max_tokens=100,
-            system="You extract relevant keywords as tags from text. Respond only with a JSON array of strings.",
-            messages=[{"role": "user", "content": prompt}]
+        chunks = 0
+        loop = asyncio.get_running_loop()
+        
+        async with asyncio.timeout(STREAM_IDLE_TIMEOUT) as deadline:
+            async with client.messages.stream(**params) as stream:
+                async for event in stream:
+                    # Every event pushes the deadline back; only a stalled
+                    # stream times out
+                    deadline.reschedule(loop.time() + STREAM_IDLE_TIMEOUT)
+                    if event.type != "content_block_delta":
+                        continue
+                    chunks += 1
+                    if on_progress and chunks % STREAM_PROGRESS_INTERVAL == 0:
+                        on_progress(chunks)
+                message = await stream.get_final_message()
+        
+        return _message_result(message)
+    
+    def _build_params(
+        self, 
+        instructions: str, 
+        details: str, 
+        max_tokens: int, 
+        model: Optional[str] = None, 
+        system: Optional[str] = None, 
+        tool: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Build request parameters, marking the fixed prompt text for prompt caching.
+        
+        Args:
+            instructions: Fixed instructions (cached prefix of the user message)
+            details: Per-request details appended after the instructions
+            max_tokens: Maximum number of tokens to generate
+            model: Model to use (defaults to default_model)
+            system: Optional fixed system prompt
+            tool: Optional tool that Claude is forced to answer with
+            
+        Returns:
+            Parameters for messages.create() / messages.stream()
+        """
+        params = dict(
+            model=model or self.default_model,
+            max_tokens=max_tokens,
+            messages=[_user_message(instructions, details)]
         )
+        if system:
+            params["system"] = [_cached_block(system)]
+        if tool:
+            params["tools"] = [tool]
+            params["tool_choice"] = {"type": "tool", "name": tool["name"]}
+        return params
+    
+    async def _call(
+        self, 
+        method_name: str, 
+        params: Dict, 
+        on_progress: Optional[Callable[[int], None]] = None, 
+        semantic_text: Optional[str] = None, 
+        semantic_scope: str = ""
+    ) -> Any:
+        """
+        Send a request to Claude, answering from the response caches when possible.
         
-        try:
-            # Extract the JSON array from the response
-            content = response.content[0].text
-            # Find the JSON array in the response
-            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-            if json_match:
-                tags = json.loads(json_match.group(0))
-                return tags
-            return []
-        except Exception as e:
-            print(f"Error extracting tags: {e}")
-            return []
+        Args:
+            method_name: Name of the calling method (part of the cache key)
+            params: Request parameters from _build_params()
+            on_progress: Optional streaming progress callback
+            semantic_text: Input text for semantic cache matching (see _cached)
+            semantic_scope: Inputs that must match exactly for a semantic hit
+            
+        Returns:
+            The tool input if the request forces a tool call, otherwise the response text
+        """
+        return await self._cached(
+            method_name, params, lambda: self._stream_response(on_progress, **params),
+            semantic_text, semantic_scope
+        )
+    
+    async def extract_tags(
+        self, 
+        text_input: str, 
+        max_tags: int = 10, 
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> List[str]:
+        """
+        Extract relevant tags from user input using Claude.
+        
+        Args:
+            text_input: Text to extract tags from
+            max_tags: Maximum number of tags to extract
+            on_progress: Optional streaming progress callback
+            
+        Returns:
+            List of extracted tags
+        """
+        params = self._build_params(
+            _TAGS_INSTRUCTIONS, f"Maximum tags: {max_tags}\n\nDescription: {text_input}",
+            max_tokens=200, model=self.fast_model, system=_TAGS_SYSTEM_PROMPT,
+            tool=_TAGS_TOOL
+        )
+        result = await self._call(
+            "extract_tags", params, on_progress,
+            semantic_text=text_input, semantic_scope=f"max_tags={max_tags}"
+        )
+        return result["tags"]
     
-    def generate_3d_prompt(
+    async def generate_3d_prompt(
         self, 
         concept: str, 
         project_type: str, 
         genre: str, 
-        description: str
+        description: str, 
+        on_progress: Optional[Callable[[int], None]] = None
     ) -> str:
         """
         Generate a detailed prompt for text-to-3D generation.
@@ -91,36 +564,24 @@ class ClaudeService:
             project_type: Type of project (e.g., "Video Game")
             genre: Genre (e.g., "Sci-Fi")
             description: Additional description
+            on_progress: Optional streaming progress callback
             
         Returns:
             Detailed prompt for text-to-3D generation
         """
-        prompt = f"""
-        Create a detailed 3D model description for:
-        - Concept: {concept}
-        - Project Type: {project_type}
-        - Genre: {genre}
-        - Description: {description}
-        
-        Provide specific details about shape, texture, color, and proportions 
-        that would help a 3D modeling system create an appropriate model.
-        Include details about materials, lighting, and environment if relevant.
-        """
-        
-        response = self.client.messages.create(
-            model=self.default_model,
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}]
+        params = self._build_params(
+            _3D_PROMPT_INSTRUCTIONS, _format_project(concept, project_type, genre, description),
+            max_tokens=500
         )
-        
-        return response.content[0].text
+        return await self._call("generate_3d_prompt", params, on_progress)
     
-    def summarize_project(
+    async def summarize_project(
         self, 
         concept: str, 
         project_type: str, 
         genre: str, 
-        description: str
+        description: str, 
+        on_progress: Optional[Callable[[int], None]] = None
     ) -> str:
         """
         Generate a concise summary of the project.
@@ -130,71 +591,227 @@ class ClaudeService:
             project_type: Type of project
             genre: Genre
             description: Additional description
+            on_progress: Optional streaming progress callback
             
         Returns:
             Concise project summary
         """
-        prompt = f"""
-        Create a concise summary (2-3 sentences) for this Blender project:
-        - Concept: {concept}
-        - Project Type: {project_type}
-        - Genre: {genre}
-        - Description: {description}
-        """
-        
-        response = self.client.messages.create(
-            model=self.default_model,
-            max_tokens=200,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        return response.content[0].text.strip()
+        params = self._summary_params(concept, project_type, genre, description)
+        content = await self._call("summarize_project", params, on_progress)
+        return content.strip()
     
-    def suggest_improvements(self, session_data: Dict) -> List[str]:
+    async def suggest_improvements(
+        self, 
+        session_data: Dict, 
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> List[str]:
         """
         Suggest improvements for the ideation session.
         
         Args:
             session_data: Session data dictionary
+            on_progress: Optional streaming progress callback
             
         Returns:
             List of improvement suggestions
         """
-        # Construct a prompt based on the session data
-        concept = session_data.get("title", "Unknown")
-        project_type = session_data.get("project_type", "Unknown")
-        genre = session_data.get("genre", "Unknown")
-        description = session_data.get("description", "")
+        params = self._suggestion_params(session_data)
+        result = await self._call(
+            "suggest_improvements", params, on_progress,
+            semantic_text=_format_project(*_session_fields(session_data))
+        )
+        return result["suggestions"]
+    
+    def _summary_params(
+        self, 
+        concept: str, 
+        project_type: str, 
+        genre: str, 
+        description: str
+    ) -> Dict:
+        """Build the request parameters for a project summary."""
+        return self._build_params(
+            _SUMMARY_INSTRUCTIONS, _format_project(concept, project_type, genre, description),
+            max_tokens=120, model=self.fast_model
+        )
+    
+    def _suggestion_params(self, session_data: Dict) -> Dict:
+        """Build the request parameters for improvement suggestions."""
+        return self._build_params(
+            _SUGGESTIONS_INSTRUCTIONS, _format_project(*_session_fields(session_data)),
+            max_tokens=500, model=self.fast_model, system=_SUGGESTIONS_SYSTEM_PROMPT,
+            tool=_SUGGESTIONS_TOOL
+        )
+    
+    def _run_batch(
+        self, 
+        method_name: str, 
+        requests: Dict[str, Dict], 
+        poll_interval: float
+    ) -> Dict[str, Any]:
+        """
+        Run requests through the Message Batches API and wait for the results.
+        Requests already in the exact-match cache are answered from it, and
+        fresh results are added to it.
+        
+        Args:
+            method_name: Name of the equivalent live method (part of the cache key)
+            requests: Request parameters keyed by custom ID
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Results (tool input or response text) keyed by custom ID;
+            failed requests are omitted
+        """
+        results = {}
+        pending = {}
+        for custom_id, params in requests.items():
+            cached = None
+            if self.cache_dir:
+                cached = self._read_cache(self._cache_path(method_name, params))
+            if cached is not None:
+                results[custom_id] = cached
+            else:
+                pending[custom_id] = params
         
-        prompt = f"""
-        Suggest 3-5 specific improvements or additions for this Blender project:
-        - Concept: {concept}
-        - Project Type: {project_type}
-        - Genre: {genre}
-        - Description: {description}
+        if not pending:
+            return results
+        
+        batch = self.client.messages.batches.create(requests=[
+            {"custom_id": custom_id, "params": params}
+            for custom_id, params in pending.items()
+        ])
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+        
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                print(f"Batch request {entry.custom_id} {entry.result.type}")
+                continue
+            
+            try:
+                result = _message_result(entry.result.message)
+            except RuntimeError as e:
+                print(f"Batch request {entry.custom_id} failed: {e}")
+                continue
+            results[entry.custom_id] = result
+            if self.cache_dir:
+                self._write_cache(
+                    self._cache_path(method_name, pending[entry.custom_id]), result
+                )
         
-        Format your response as a JSON array of strings, where each string is a specific suggestion.
+        return results
+    
+    def batch_summarize(
+        self, 
+        sessions: List[Dict], 
+        poll_interval: float = BATCH_POLL_INTERVAL
+    ) -> Dict[str, str]:
         """
+        Summarize many sessions at once through the Message Batches API.
+        Batches are billed at half the live price but can take minutes to
+        hours, so this is meant for non-interactive processing.
         
-        response = self.client.messages.create(
-            model=self.default_model,
-            max_tokens=350,
-            system="You provide helpful suggestions for 3D design projects. Respond only with a JSON array of strings.",
-            messages=[{"role": "user", "content": prompt}]
-        )
+        Args:
+            sessions: Session data dictionaries (each must have an "id")
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Project summaries keyed by session ID
+        """
+        requests = {
+            session["id"]: self._summary_params(*_session_fields(session))
+            for session in sessions
+        }
+        results = self._run_batch("summarize_project", requests, poll_interval)
+        return {session_id: content.strip() for session_id, content in results.items()}
+    
+    def batch_suggest_improvements(
+        self, 
+        sessions: List[Dict], 
+        poll_interval: float = BATCH_POLL_INTERVAL
+    ) -> Dict[str, List[str]]:
+        """
+        Suggest improvements for many sessions at once through the Message Batches API.
         
+        Args:
+            sessions: Session data dictionaries (each must have an "id")
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Improvement suggestions keyed by session ID
+        """
+        requests = {session["id"]: self._suggestion_params(session) for session in sessions}
+        results = self._run_batch("suggest_improvements", requests, poll_interval)
+        return {
+            session_id: result["suggestions"]
+            for session_id, result in results.items()
+        }
+
+
+# Output directories the mock generators have already created; the app
+# creates its directories at startup, so this only costs a set lookup per call
+_READY_OUTPUT_DIRS = set()
+
+
+def _ensure_output_dir(output_dir: str):
+    """Create a generator output directory the first time it is used."""
+    if output_dir not in _READY_OUTPUT_DIRS:
+        os.makedirs(output_dir, exist_ok=True)
+        _READY_OUTPUT_DIRS.add(output_dir)
+
+
+def _forget_output_dir(output_dir: str):
+    """Forget that a directory (and its mock model template) was set up,
+    e.g. after it was deleted while the app was running."""
+    _READY_OUTPUT_DIRS.discard(output_dir)
+    _READY_MOCK_TEMPLATES.discard(output_dir)
+
+
+# Placeholder content for mock 3D models, written once per output directory
+# to a hidden template that generated models are hard-linked to
+_MOCK_MODEL_DATA = b'MOCK 3D MODEL'
+_MOCK_MODEL_TEMPLATE = ".mock_model.glb"
+_READY_MOCK_TEMPLATES = set()
+
+
+def _write_mock_model(output_path: str, retry: bool = True):
+    """
+    Create a placeholder model file, creating its directory if needed.
+    Hard-links the directory's template (an inode operation, no data write),
+    falling back to a copy where hard links aren't supported.
+    
+    Args:
+        output_path: Path of the model file to create
+        retry: Whether to set the directory up again and retry once if it or
+            its template has been deleted since it was first used
+    """
+    output_dir = os.path.dirname(output_path)
+    template_path = os.path.join(output_dir, _MOCK_MODEL_TEMPLATE)
+    _ensure_output_dir(output_dir)
+    if output_dir not in _READY_MOCK_TEMPLATES:
+        # Never rewrite an existing template: that would also rewrite every
+        # model linked to it
+        if not os.path.exists(template_path):
+            with open(template_path, 'wb') as f:
+                f.write(_MOCK_MODEL_DATA)
+        _READY_MOCK_TEMPLATES.add(output_dir)
+    
+    try:
         try:
-            # Extract the JSON array from the response
-            content = response.content[0].text
-            # Find the JSON array in the response
-            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-            if json_match:
-                suggestions = json.loads(json_match.group(0))
-                return suggestions
-            return []
-        except Exception as e:
-            print(f"Error extracting suggestions: {e}")
-            return []
+            os.link(template_path, output_path)
+        except FileExistsError:
+            # A placeholder with this name was already generated
+            pass
+        except OSError:
+            shutil.copyfile(template_path, output_path)
+    except FileNotFoundError:
+        # The directory or template was deleted while the app was running
+        if not retry:
+            raise
+        _forget_output_dir(output_dir)
+        _write_mock_model(output_path, retry=False)
 
 
 class MockImageGenerator:
@@ -203,29 +820,51 @@ class MockImageGenerator:
     In a production environment, this would be replaced with a real AI image generation service.
     """
     
-    def convert_sketch_to_image(self, sketch_path: str, output_dir: str) -> Optional[str]:
+    def convert_sketch_to_image(
+        self, 
+        sketch: Union[str, BinaryIO, Image.Image], 
+        output_dir: str, 
+        filename: Optional[str] = None
+    ) -> Optional[str]:
         """
         Convert a sketch to a rendered image.
         
         Args:
-            sketch_path: Path to the sketch image
+            sketch: Path to the sketch image, a file object containing it,
+                or an already opened PIL Image
             output_dir: Directory to save the output image
+            filename: Sketch file name used to name the output
+                (defaults to the name of the sketch file)
             
         Returns:
             Path to the output image, or None if conversion fails
         """
+        from PIL import Image
+        
         try:
-            # Load the sketch
-            img = Image.open(sketch_path)
+            # Load the sketch unless it is already an image
+            img = sketch if isinstance(sketch, Image.Image) else Image.open(sketch)
+            filename = filename or os.path.basename(img.filename)
             
             # For the mock implementation, just add a blue tint
             # In a real implementation, this would use an AI model
-            processed = add_color_tint(img, (100, 100, 255), 0.3)
+            # Image.blend does the whole lerp in one vectorized pass; keep
+            # the alpha channel only if the sketch has one
+            mode = "RGBA" if img.has_transparency_data else "RGB"
+            img = img.convert(mode)
+            tint = Image.new(mode, img.size, (100, 100, 255, 255)[:len(mode)])
+            processed = Image.blend(img, tint, 0.3)
             
             # Save the processed image
-            os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, f"rendered_{os.path.basename(sketch_path)}")
-            processed.save(output_path)
+            _ensure_output_dir(output_dir)
+            output_path = os.path.join(output_dir, f"rendered_{filename}")
+            try:
+                processed.save(output_path)
+            except FileNotFoundError:
+                # The directory was deleted while the app was running
+                _forget_output_dir(output_dir)
+                _ensure_output_dir(output_dir)
+                processed.save(output_path)
             
             return output_path
         except Exception as e:
@@ -252,12 +891,10 @@ class Mock3DGenerator:
         """
         # For the mock implementation, just return a placeholder path
         # In a real implementation, this would use an AI model or API
-        os.makedirs(output_dir, exist_ok=True)
         output_path = os.path.join(output_dir, f"model_from_sketch_{os.path.basename(image_path)}.glb")
         
-        # Create an empty file to simulate the output
-        with open(output_path, 'wb') as f:
-            f.write(b'MOCK 3D MODEL')
+        # Create a placeholder file to simulate the output
+        _write_mock_model(output_path)
         
         return output_path
     
@@ -274,17 +911,14 @@ class Mock3DGenerator:
         """
         # For the mock implementation, just return a placeholder path
         # In a real implementation, this would use an AI model or API
-        os.makedirs(output_dir, exist_ok=True)
         
         # Generate a filename based on the first few words of the prompt
         words = text_prompt.split()[:3]
-        filename = "_".join(words).lower()
-        filename = re.sub(r'[^\w\-_]', '', filename)  # Remove non-alphanumeric chars
+        filename = "_".join(words).lower().translate(_FILENAME_DELETE_TABLE)
         
         output_path = os.path.join(output_dir, f"model_from_text_{filename}.glb")
         
-        # Create an empty file to simulate the output
-        with open(output_path, 'wb') as f:
-            f.write(b'MOCK 3D MODEL')
+        # Create a placeholder file to simulate the output
+        _write_mock_model(output_path)
         
         return output_path
\ No newline at end of file
@@ -3,11 +3,17 @@ Main application for the Blender Ideation Agent.
 Streamlit-based user interface for the ideation whiteboard.
 """
 
+import argparse
+import asyncio
+import glob
+import io
 import os
 import tempfile
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -15,7 +21,7 @@ from dotenv import load_dotenv
 from blender_ideation.ai_services import ClaudeService, Mock3DGenerator, MockImageGenerator
 from blender_ideation.blender_integration import BlenderIntegration
 from blender_ideation.data_models import IdeationSession
-from blender_ideation.utils import ensure_directory, save_session_to_json
+from blender_ideation.utils import ensure_directory, load_session_from_json, save_session_to_json
 
 # Load environment variables from .env file
 load_dotenv()
@@ -26,6 +32,46 @@ SKETCHES_DIR = os.path.join(BASE_DIR, "sketches")
 IMAGES_DIR = os.path.join(BASE_DIR, "images")
 MODELS_DIR = os.path.join(BASE_DIR, "models")
 SESSIONS_DIR = os.path.join(BASE_DIR, "sessions")
+CACHE_DIR = os.path.join(BASE_DIR, "cache")
+
+
+@st.cache_resource
+def get_claude_service() -> ClaudeService:
+    """Get the Claude service, shared across reruns and browser sessions."""
+    claude = ClaudeService(cache_dir=CACHE_DIR)
+    print("Claude service initialized")
+    return claude
+
+
+@st.cache_resource
+def get_io_pool() -> ThreadPoolExecutor:
+    """
+    Get the background pool for disk writes that the UI doesn't need to wait
+    for. Streamlit re-executes this module on every rerun, so the pool must
+    be cached to be shared; its single worker keeps successive saves of the
+    same session in order.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-io")
+
+
+@st.cache_resource
+def get_image_generator() -> MockImageGenerator:
+    """Get the sketch-to-image generator, shared across reruns and browser sessions."""
+    return MockImageGenerator()
+
+
+@st.cache_resource
+def get_model_generator() -> Mock3DGenerator:
+    """Get the 3D model generator, shared across reruns and browser sessions."""
+    return Mock3DGenerator()
+
+
+@st.cache_resource
+def get_blender_integration() -> BlenderIntegration:
+    """Get the Blender integration, shared across reruns and browser sessions."""
+    blender = BlenderIntegration()
+    print(f"Blender integration initialized with executable: {blender.blender_path}")
+    return blender
 
 
 class BlenderIdeationApp:
@@ -40,20 +86,22 @@ class BlenderIdeationApp:
         self.blender = None
     
     def _initialize_services(self):
-        """Initialize AI and Blender services."""
+        """
+        Initialize AI and Blender services.
+        Services are built once and reused on every rerun; failed
+        initialization is not cached, so it is retried on the next rerun.
+        """
         try:
-            self.claude = ClaudeService()
-            print("Claude service initialized")
+            self.claude = get_claude_service()
         except ValueError as e:
             st.error(f"Error initializing Claude service: {e}")
             self.claude = None
         
-        self.image_generator = MockImageGenerator()
-        self.model_generator = Mock3DGenerator()
+        self.image_generator = get_image_generator()
+        self.model_generator = get_model_generator()
         
         try:
-            self.blender = BlenderIntegration()
-            print(f"Blender integration initialized with executable: {self.blender.blender_path}")
+            self.blender = get_blender_integration()
         except ValueError as e:
             st.warning(f"Blender integration not available: {e}")
             self.blender = None
@@ -106,10 +154,14 @@ class BlenderIdeationApp:
         Returns:
             New ideation session
         """
-        # Extract tags using Claude
+        # Extract tags and summarize the project using Claude; the two
+        # requests are independent, so issue them concurrently
         tags = []
+        summary = ""
         if self.claude:
-            tags = self.claude.extract_tags(f"{title} {project_type} {genre} {description}")
+            tags, summary = asyncio.run(self._analyze_project(
+                title, project_type, genre, description
+            ))
         
         # Create session
         session = IdeationSession(
@@ -118,6 +170,7 @@ class BlenderIdeationApp:
             project_type=project_type,
             genre=genre,
             description=description,
+            summary=summary,
             tags=tags
         )
         
@@ -125,6 +178,62 @@ class BlenderIdeationApp:
         self.current_session = session
         return session
     
+    def _stream_progress(self, label: str) -> Callable[[int], None]:
+        """
+        Create a callback that reports streaming progress in a placeholder.
+        
+        Args:
+            label: Label shown next to the chunk count
+            
+        Returns:
+            Callback taking the number of chunks received so far
+        """
+        placeholder = st.empty()
+        return lambda chunks: placeholder.write(f"{label}: {chunks} chunks received")
+    
+    async def _analyze_project(
+        self, 
+        title: str, 
+        project_type: str, 
+        genre: str, 
+        description: str
+    ) -> Tuple[List[str], str]:
+        """
+        Fetch tags and a summary for a project concurrently.
+        
+        Args:
+            title: Project concept/title
+            project_type: Type of project
+            genre: Genre
+            description: Additional description
+            
+        Returns:
+            Tuple of (tags, summary)
+        """
+        # Both requests share one client, closed when this handler is done.
+        # Either may fail (e.g. time out) without losing the other or the
+        # session itself.
+        async with self.claude.connect():
+            tags, summary = await asyncio.gather(
+                self.claude.extract_tags(
+                    f"{title} {project_type} {genre} {description}",
+                    on_progress=self._stream_progress("Extracting tags")
+                ),
+                self.claude.summarize_project(
+                    title, project_type, genre, description,
+                    on_progress=self._stream_progress("Summarizing project")
+                ),
+                return_exceptions=True,
+            )
+        
+        if isinstance(tags, Exception):
+            st.warning(f"Could not extract tags: {str(tags) or type(tags).__name__}")
+            tags = []
+        if isinstance(summary, Exception):
+            st.warning(f"Could not summarize the project: {str(summary) or type(summary).__name__}")
+            summary = ""
+        return tags, summary
+    
     def process_sketch(self, uploaded_file) -> Optional[IdeationSession]:
         """
         Process an uploaded sketch.
@@ -139,30 +248,49 @@ class BlenderIdeationApp:
             st.error("No active session")
             return None
         
-        # Save the uploaded file
+        # Save the uploaded file in the background; the pipeline works from
+        # the in-memory upload, so it doesn't wait for the disk write
+        sketch_data = uploaded_file.getvalue()
         sketch_path = os.path.join(SKETCHES_DIR, f"{self.current_session.id}_{uploaded_file.name}")
-        with open(sketch_path, "wb") as f:
-            f.write(uploaded_file.getvalue())
+        write_errors: List[Exception] = []
         
-        self.current_session.sketch_path = sketch_path
+        def write_sketch() -> None:
+            try:
+                Path(sketch_path).write_bytes(sketch_data)
+            except Exception as e:
+                write_errors.append(e)
         
-        # Convert sketch to image
-        st.info("Using sketch-to-image tool...")
-        image_path = self.image_generator.convert_sketch_to_image(sketch_path, IMAGES_DIR)
-        if not image_path:
-            st.error("Failed to convert sketch to image")
-            return self.current_session
-        
-        self.current_session.rendered_image_path = image_path
-        
-        # Convert image to 3D
-        st.info("Using image-to-3D tool...")
-        model_path = self.model_generator.sketch_to_3d(image_path, MODELS_DIR)
-        if not model_path:
-            st.error("Failed to convert image to 3D model")
-            return self.current_session
+        writer = threading.Thread(target=write_sketch)
+        writer.start()
         
-        self.current_session.sketch_3d_path = model_path
+        try:
+            # Convert sketch to image
+            st.info("Using sketch-to-image tool...")
+            image_path = self.image_generator.convert_sketch_to_image(
+                io.BytesIO(sketch_data), IMAGES_DIR, os.path.basename(sketch_path)
+            )
+            if not image_path:
+                st.error("Failed to convert sketch to image")
+                return self.current_session
+            
+            self.current_session.rendered_image_path = image_path
+            
+            # Convert image to 3D
+            st.info("Using image-to-3D tool...")
+            model_path = self.model_generator.sketch_to_3d(image_path, MODELS_DIR)
+            if not model_path:
+                st.error("Failed to convert image to 3D model")
+                return self.current_session
+            
+            self.current_session.sketch_3d_path = model_path
+        finally:
+            # The sketch is displayed from disk right after this returns
+            writer.join()
+            if write_errors:
+                # Leave sketch_path unset so the sketch can be processed again
+                st.error(f"Failed to save sketch: {write_errors[0]}")
+            else:
+                self.current_session.sketch_path = sketch_path
         
         # Update session
         self.current_session = self.current_session
@@ -184,14 +312,19 @@ class BlenderIdeationApp:
         # Generate detailed prompt for 3D model
         prompt = ""
         if self.claude:
-            prompt = self.claude.generate_3d_prompt(
-                self.current_session.title,
-                self.current_session.project_type,
-                self.current_session.genre,
-                self.current_session.description
-            )
-        else:
-            # Fallback prompt if Claude is not available
+            try:
+                prompt = asyncio.run(self.claude.generate_3d_prompt(
+                    self.current_session.title,
+                    self.current_session.project_type,
+                    self.current_session.genre,
+                    self.current_session.description,
+                    on_progress=self._stream_progress("Generating 3D prompt")
+                ))
+            except Exception as e:
+                # A stalled stream or API error shouldn't stop the generation
+                st.warning(f"Could not generate the 3D prompt: {str(e) or type(e).__name__}")
+        if not prompt:
+            # Fallback prompt if Claude is not available or failed
             prompt = f"A 3D {self.current_session.title} for a {self.current_session.project_type} in the {self.current_session.genre} genre."
         
         # Generate 3D model from text
@@ -211,22 +344,19 @@ class BlenderIdeationApp:
         Save the current session.
         
         Returns:
-            True if saved successfully, False otherwise
+            True if the save was started, False if there is no session
         """
         if not self.current_session:
             st.error("No active session to save")
             return False
         
-        # Save session data to JSON
+        # Save session data to JSON in the background; the dictionary is a
+        # snapshot, so later edits to the session don't race the write
         session_path = os.path.join(SESSIONS_DIR, f"{self.current_session.id}.json")
-        success = save_session_to_json(self.current_session.to_dict(), session_path)
+        get_io_pool().submit(save_session_to_json, self.current_session.to_dict(), session_path)
         
-        if success:
-            st.success("Ideation Whiteboard saved successfully!")
-        else:
-            st.error("Failed to save Ideation Whiteboard")
-        
-        return success
+        st.success("Ideation Whiteboard saved successfully!")
+        return True
     
     def export_to_blender(self) -> Optional[str]:
         """
@@ -313,10 +443,18 @@ class BlenderIdeationApp:
             if self.current_session.tags:
                 st.markdown("**Tags**: " + ", ".join(self.current_session.tags))
             
+            if self.current_session.summary:
+                st.markdown(f"**Summary**: {self.current_session.summary}")
+            
             if self.current_session.description:
                 with st.expander("Description", expanded=False):
                     st.write(self.current_session.description)
             
+            if self.current_session.suggestions:
+                with st.expander("Suggested Improvements", expanded=False):
+                    for suggestion in self.current_session.suggestions:
+                        st.markdown(f"- {suggestion}")
+            
             # Canvas for sketching or upload
             st.subheader("Your Robot Sketch")
             uploaded_file = st.file_uploader(
@@ -395,7 +533,7 @@ def main():
     )
     
     # Ensure directories exist
-    for directory in [SKETCHES_DIR, IMAGES_DIR, MODELS_DIR, SESSIONS_DIR]:
+    for directory in [SKETCHES_DIR, IMAGES_DIR, MODELS_DIR, SESSIONS_DIR, CACHE_DIR]:
         ensure_directory(directory)
     
     # Create and run the app
@@ -403,5 +541,61 @@ def main():
     app.run()
 
 
+def batch_main():
+    """
+    Batch entry point: fill in missing summaries and improvement suggestions
+    for all saved sessions using the Message Batches API.
+    """
+    parser = argparse.ArgumentParser(
+        description="Summarize saved ideation sessions and suggest improvements in bulk."
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=60.0,
+        help="Seconds between batch status checks (default: 60)"
+    )
+    args = parser.parse_args()
+    
+    ensure_directory(CACHE_DIR)
+    claude = ClaudeService(cache_dir=CACHE_DIR)
+    
+    sessions = {}
+    for session_path in glob.glob(os.path.join(SESSIONS_DIR, "*.json")):
+        session = load_session_from_json(session_path)
+        if session and session.get("id"):
+            sessions[session_path] = session
+    
+    to_summarize = [s for s in sessions.values() if not s.get("summary")]
+    to_suggest = [s for s in sessions.values() if not s.get("suggestions")]
+    print(
+        f"Found {len(sessions)} sessions: {len(to_summarize)} need summaries, "
+        f"{len(to_suggest)} need suggestions"
+    )
+    
+    # Submit both batches up front and wait for them together
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        summaries_future = pool.submit(
+            claude.batch_summarize, to_summarize, args.poll_interval
+        )
+        suggestions_future = pool.submit(
+            claude.batch_suggest_improvements, to_suggest, args.poll_interval
+        )
+    summaries = summaries_future.result()
+    suggestions = suggestions_future.result()
+    
+    updated = 0
+    for session_path, session in sessions.items():
+        changed = False
+        if session["id"] in summaries:
+            session["summary"] = summaries[session["id"]]
+            changed = True
+        if session["id"] in suggestions:
+            session["suggestions"] = suggestions[session["id"]]
+            changed = True
+        if changed and save_session_to_json(session, session_path):
+            updated += 1
+    
+    print(f"Updated {updated} sessions")
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,15 +3,322 @@ Blender Integration Component for the Ideation Agent.
 Handles the connection between the ideation agent and Blender.
 """
 
+import atexit
+import json
 import os
 import subprocess
 import tempfile
-import time
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from blender_ideation.utils import find_blender_executable
 
+# Static scripts run inside Blender
+_SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts")
+_WORKER_SCRIPT = os.path.join(_SCRIPTS_DIR, "worker.py")
+_IMPORT_MODEL_SCRIPT = os.path.join(_SCRIPTS_DIR, "import_model.py")
+_BUILD_SCENE_SCRIPT = os.path.join(_SCRIPTS_DIR, "build_scene.py")
+_IMPORT_PARTIAL_SCRIPT = os.path.join(_SCRIPTS_DIR, "import_partial.py")
+
+# Total model size above which scene models are imported by parallel Blender
+# processes; below it, the extra Blender startups cost more than they save
+PARALLEL_IMPORT_MIN_BYTES = 20 * 1024 * 1024
+
+# Prefix of the worker's reply lines (must match scripts/worker.py)
+_WORKER_REPLY_PREFIX = "@@blender_ideation@@ "
+
+# Lines of Blender output kept to explain a failed one-off run
+_OUTPUT_TAIL_LINES = 50
+
+# Threads that wait on Blender for the *_async methods
+_JOB_POOL = ThreadPoolExecutor(thread_name_prefix="blender-job")
+
+
+class BlenderJob(Future):
+    """
+    Future for a Blender job started by one of the *_async methods.
+    Unlike a plain Future, cancel() also stops a job that is already running
+    by terminating its Blender processes. Such a job then reports itself as
+    cancelled like one cancelled before it started: cancelled() is True and
+    result() and exception() raise CancelledError.
+    """
+    
+    def __init__(self, on_progress: Optional[Callable[[str], None]] = None):
+        """
+        Initialize the job.
+        
+        Args:
+            on_progress: Optional callback receiving each line of Blender output
+        """
+        super().__init__()
+        self.on_progress = on_progress
+        self.stopping = False
+        self._stopped = False
+        self._processes = set()
+        self._processes_lock = threading.Lock()
+    
+    def attach(self, process: subprocess.Popen):
+        """Track a Blender process so cancel() can terminate it."""
+        with self._processes_lock:
+            if self.stopping:
+                process.terminate()
+            self._processes.add(process)
+    
+    def detach(self, process: subprocess.Popen):
+        """Stop tracking a finished Blender process."""
+        with self._processes_lock:
+            self._processes.discard(process)
+    
+    def output(self, line: str):
+        """Forward a line of Blender output to the progress callback."""
+        if self.on_progress:
+            self.on_progress(line.rstrip("\n"))
+    
+    def cancel(self) -> bool:
+        """
+        Cancel the job, terminating its Blender processes if it is running.
+        
+        Returns:
+            True if the job was cancelled, False if it had already finished
+        """
+        if super().cancel():
+            return True
+        
+        with self._processes_lock:
+            if self.done():
+                return False
+            self.stopping = True
+            for process in self._processes:
+                process.terminate()
+        return True
+    
+    def cancelled(self) -> bool:
+        """Return True if the job was cancelled, before or while running."""
+        return self._stopped or super().cancelled()
+    
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Return the job's exception, raising CancelledError if it was cancelled."""
+        error = super().exception(timeout)
+        if self._stopped:
+            raise CancelledError()
+        return error
+    
+    def set_stopped(self):
+        """Resolve a job stopped by cancel() while it was running."""
+        # Set before resolving, so done callbacks already see cancelled()
+        self._stopped = True
+        self.set_exception(CancelledError())
+
+
+def _describe_error(e: Exception) -> str:
+    """Describe a Blender failure, including the end of its output if captured."""
+    if isinstance(e, subprocess.CalledProcessError) and e.output:
+        return f"{e}\n{e.output}"
+    return str(e)
+
+
+def _temp_blend_path(prefix: str) -> str:
+    """
+    Create a uniquely named, empty temporary .blend file for Blender to save
+    over. Unlike a timestamped name, this can't collide between concurrent calls.
+    
+    Args:
+        prefix: Prefix of the file name
+        
+    Returns:
+        Path to the file
+    """
+    fd, path = tempfile.mkstemp(suffix=".blend", prefix=prefix)
+    os.close(fd)
+    return path
+
+
+def _remove_temp_blend(path: str):
+    """Remove a temporary .blend file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _submit_job(fn: Callable, on_progress: Optional[Callable[[str], None]] = None) -> BlenderJob:
+    """
+    Run fn(job) on the job pool.
+    
+    Args:
+        fn: Function to run, receiving the job
+        on_progress: Optional callback receiving each line of Blender output
+        
+    Returns:
+        The job, resolving to fn's return value
+    """
+    job = BlenderJob(on_progress)
+    
+    def run():
+        if not job.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(job)
+        except BaseException as e:
+            if job.stopping:
+                job.set_stopped()
+            else:
+                job.set_exception(e)
+        else:
+            if job.stopping:
+                job.set_stopped()
+            else:
+                job.set_result(result)
+    
+    _JOB_POOL.submit(run)
+    return job
+
+
+class _BlenderWorker:
+    """
+    A long-lived background Blender process that runs scripts on request.
+    Starting Blender dominates the cost of a short script, so keeping one
+    process alive amortizes the startup across all imports and scenes.
+    """
+    
+    def __init__(self, blender_path: str):
+        """
+        Initialize the worker (Blender is started on first use).
+        
+        Args:
+            blender_path: Path to the Blender executable
+        """
+        self.blender_path = blender_path
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start Blender if it isn't running (e.g. on first use or after a crash)."""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [self.blender_path, "--background", "--python", _WORKER_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+        return self._process
+    
+    def _kill(self, process: subprocess.Popen):
+        """Kill the worker; it is restarted on next use."""
+        process.kill()
+        process.wait()
+    
+    def request(self, command: Dict, job: Optional[BlenderJob] = None) -> Dict:
+        """
+        Send a command to the worker and wait for its reply.
+        
+        Args:
+            command: JSON-serializable command with an "op" key
+            job: Optional job receiving the output and able to cancel the
+                command (which terminates the worker; it restarts on next use)
+            
+        Returns:
+            The worker's reply
+            
+        Raises:
+            RuntimeError: If the command fails or the worker exits
+        """
+        with self._lock:
+            process = self._ensure_started()
+            if job:
+                job.attach(process)
+            try:
+                try:
+                    process.stdin.write(json.dumps(command) + "\n")
+                    process.stdin.flush()
+                except OSError as e:
+                    raise RuntimeError(f"Blender worker is not accepting commands: {e}")
+                
+                reply = self._read_reply(process, job)
+            except BaseException:
+                # Without a complete reply the command may still be running
+                # and its reply still pending, which would be read as the
+                # next command's; restart the worker instead
+                self._kill(process)
+                raise
+            finally:
+                if job:
+                    job.detach(process)
+        
+        if not reply.get("ok"):
+            raise RuntimeError(reply.get("error", "Unknown Blender worker error"))
+        return reply
+    
+    def _read_reply(self, process: subprocess.Popen, job: Optional[BlenderJob]) -> Dict:
+        """
+        Read the worker's output up to and including its next reply.
+        
+        Raises:
+            RuntimeError: If the reply is malformed or the worker exits
+        """
+        for line in process.stdout:
+            if not line.startswith(_WORKER_REPLY_PREFIX):
+                # Blender's own console output; script errors come back in
+                # the reply, so it isn't echoed
+                if job:
+                    job.output(line)
+                continue
+            
+            try:
+                return json.loads(line[len(_WORKER_REPLY_PREFIX):])
+            except ValueError as e:
+                raise RuntimeError(f"Malformed reply from Blender worker: {e}")
+        
+        raise RuntimeError("Blender worker exited unexpectedly")
+    
+    def run_script(self, script_path: str, argv: List[str], job: Optional[BlenderJob] = None):
+        """
+        Run a Python script in the worker, in a fresh empty scene.
+        
+        Args:
+            script_path: Path to the script to run
+            argv: Arguments the script sees after `--` in sys.argv
+            job: Optional job receiving the output
+        """
+        self.request({"op": "run_script", "script": script_path, "argv": argv}, job)
+    
+    def close(self):
+        """Shut the worker down by closing its stdin."""
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                return
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+
+# One worker per Blender executable, shared by all integrations
+_workers: Dict[str, _BlenderWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def _get_worker(blender_path: str) -> _BlenderWorker:
+    """Get the shared worker for a Blender executable."""
+    with _workers_lock:
+        if blender_path not in _workers:
+            _workers[blender_path] = _BlenderWorker(blender_path)
+        return _workers[blender_path]
+
+
+@atexit.register
+def _close_workers():
+    """Shut down all workers when the interpreter exits."""
+    for worker in list(_workers.values()):
+        worker.close()
+
 
 class BlenderIntegration:
     """
@@ -20,17 +327,161 @@ class BlenderIntegration:
     based on your specific Blender workflow.
     """
     
-    def __init__(self, blender_executable_path: Optional[str] = None):
+    def __init__(self, blender_executable_path: Optional[str] = None, persistent: bool = True):
         """
         Initialize the Blender integration component.
         
         Args:
             blender_executable_path: Path to the Blender executable.
                 If None, will try to find Blender in standard locations.
+            persistent: Run scripts in a shared long-lived Blender process
+                instead of starting Blender for every call.
         """
         self.blender_path = blender_executable_path or find_blender_executable()
         if not self.blender_path:
             raise ValueError("Could not find Blender executable. Please specify the path manually.")
+        self.persistent = persistent
+    
+    def _run_script(
+        self, 
+        script_path: str, 
+        params: Dict, 
+        persistent: Optional[bool] = None, 
+        job: Optional[BlenderJob] = None
+    ):
+        """
+        Run one of the static scripts in background Blender.
+        
+        Args:
+            script_path: Path to the script to run
+            params: JSON-serializable parameters, passed to the script
+                as `--args JSON` after `--`
+            persistent: Whether to use the persistent worker.
+                If None, uses the integration's setting.
+            job: Optional job receiving the output and able to cancel the run
+            
+        Raises:
+            RuntimeError: If the script fails in the persistent worker
+            subprocess.CalledProcessError: If a one-off Blender process fails
+        """
+        # Pass the parameters inline, so no args file is created per call
+        argv = ["--args", json.dumps(params)]
+        
+        if persistent is None:
+            persistent = self.persistent
+        
+        if persistent:
+            _get_worker(self.blender_path).run_script(script_path, argv, job)
+            return
+        
+        # Blender exits 0 when a --python script raises unless asked otherwise
+        process = subprocess.Popen([
+            self.blender_path,
+            "--background",
+            "--python-exit-code", "1",
+            "--python", script_path,
+            "--", *argv
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf-8", errors="replace", bufsize=1)
+        if job:
+            job.attach(process)
+        
+        # Blender's console output isn't echoed, but its last lines are kept
+        # to explain a failure
+        tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+        try:
+            for line in process.stdout:
+                tail.append(line)
+                if job:
+                    job.output(line)
+            returncode = process.wait()
+        finally:
+            if job:
+                job.detach(process)
+        
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, process.args, output="".join(tail))
+    
+    def _import_one(self, model_path: str, job: Optional[BlenderJob] = None) -> str:
+        """
+        Import a model in its own Blender process into a partial .blend file.
+        
+        Args:
+            model_path: Path to the 3D model file
+            job: Optional job receiving the output
+            
+        Returns:
+            Path to the partial Blender file
+            
+        Raises:
+            RuntimeError: If Blender exits without saving the partial file
+            subprocess.CalledProcessError: If Blender fails
+        """
+        partial_path = _temp_blend_path("ideation_partial_")
+        
+        try:
+            # Always a one-off process: the shared worker runs one job at a time
+            self._run_script(
+                _IMPORT_PARTIAL_SCRIPT,
+                {"model_path": model_path, "output_path": partial_path},
+                persistent=False,
+                job=job
+            )
+            # The script removes the empty placeholder before saving, so the
+            # file is missing or still empty if Blender didn't save it
+            if not os.path.exists(partial_path) or not os.path.getsize(partial_path):
+                raise RuntimeError(f"Blender didn't save the partial file for {model_path}")
+        except BaseException:
+            _remove_temp_blend(partial_path)
+            raise
+        return partial_path
+    
+    def _import_partials(
+        self, 
+        model_paths: List[str], 
+        max_workers: Optional[int] = None, 
+        job: Optional[BlenderJob] = None
+    ) -> Dict[str, str]:
+        """
+        Import models concurrently, each in its own Blender process.
+        
+        Args:
+            model_paths: Paths to the 3D model files
+            max_workers: Maximum number of concurrent Blender processes.
+                If None, uses min(len(model_paths), os.cpu_count()).
+            job: Optional job receiving the output
+            
+        Returns:
+            Dictionary mapping each successfully imported model path to its
+            partial Blender file
+            
+        Raises:
+            Exception: Any error other than a failed import, after removing
+                the partial files already written
+        """
+        if max_workers is None:
+            max_workers = min(len(model_paths), os.cpu_count() or 1)
+        
+        partials = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {path: executor.submit(self._import_one, path, job) for path in model_paths}
+            # Collect every import, even after an unexpected error, so no
+            # partial file is left untracked
+            for path, future in futures.items():
+                try:
+                    partials[path] = future.result()
+                except (subprocess.CalledProcessError, RuntimeError) as e:
+                    # The scene build falls back to importing this model itself
+                    print(f"Error importing model {path}: {_describe_error(e)}")
+                except BaseException as e:
+                    if error is None:
+                        error = e
+        
+        if error is not None:
+            for partial_path in partials.values():
+                _remove_temp_blend(partial_path)
+            raise error
+        return partials
     
     def import_3d_model(
         self, 
@@ -48,264 +499,185 @@ class BlenderIntegration:
         Returns:
             Path to the created Blender project file.
         """
+        return self.import_3d_model_async(model_path, blender_project_path).result()
+    
+    def import_3d_model_async(
+        self, 
+        model_path: str, 
+        blender_project_path: Optional[str] = None,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> BlenderJob:
+        """
+        Import a 3D model into a Blender project without blocking the caller.
+        
+        Args:
+            model_path: Path to the 3D model file (glb, obj, fbx, etc.)
+            blender_project_path: Path to save the resulting Blender file.
+                If None, creates a temporary file.
+            on_progress: Optional callback receiving each line of Blender output
+                (called from a background thread)
+        
+        Returns:
+            Job resolving to the path of the created Blender project file
+        """
+        return _submit_job(
+            lambda job: self._import_3d_model(model_path, blender_project_path, job),
+            on_progress
+        )
+    
+    def _import_3d_model(
+        self, 
+        model_path: str, 
+        blender_project_path: Optional[str], 
+        job: BlenderJob
+    ) -> Optional[str]:
+        """Import a 3D model into a Blender project as part of a job."""
         if not os.path.exists(model_path):
             print(f"Model file not found: {model_path}")
             return None
         
-        if blender_project_path is None:
+        reserved = blender_project_path is None
+        if reserved:
             # Create a temporary file for the Blender project
-            temp_dir = tempfile.gettempdir()
-            blender_project_path = os.path.join(temp_dir, f"ideation_{int(time.time())}.blend")
-        
-        # Create a Python script for Blender to execute
-        script_content = f"""
-import bpy
-import os
-
-# Clear default objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
-
-# Import the 3D model
-model_path = r"{model_path}"
-file_extension = os.path.splitext(model_path)[1].lower()
-
-if file_extension == '.obj':
-    bpy.ops.import_scene.obj(filepath=model_path)
-elif file_extension == '.fbx':
-    bpy.ops.import_scene.fbx(filepath=model_path)
-elif file_extension == '.glb' or file_extension == '.gltf':
-    bpy.ops.import_scene.gltf(filepath=model_path)
-elif file_extension == '.stl':
-    bpy.ops.import_mesh.stl(filepath=model_path)
-elif file_extension == '.ply':
-    bpy.ops.import_mesh.ply(filepath=model_path)
-elif file_extension == '.dae':
-    bpy.ops.wm.collada_import(filepath=model_path)
-else:
-    print(f"Unsupported file format: {{file_extension}}")
-
-# Save the file
-bpy.ops.wm.save_as_mainfile(filepath=r"{blender_project_path}")"""
+            blender_project_path = _temp_blend_path("ideation_")
         
-        # Write the script to a temporary file
-        script_path = os.path.join(tempfile.gettempdir(), "import_script.py")
-        with open(script_path, 'w') as f:
-            f.write(script_content)
+        params = {
+            "model_path": model_path,
+            "output_path": blender_project_path,
+        }
         
         # Run Blender with the script
+        succeeded = False
         try:
-            subprocess.run([
-                self.blender_path,
-                "--background",
-                "--python", script_path
-            ], check=True)
+            self._run_script(_IMPORT_MODEL_SCRIPT, params, job=job)
+            succeeded = not job.stopping
             
             print(f"Model imported and saved to {blender_project_path}")
             return blender_project_path
             
-        except subprocess.CalledProcessError as e:
-            print(f"Error importing model: {e}")
+        except (subprocess.CalledProcessError, RuntimeError) as e:
+            print(f"Error importing model: {_describe_error(e)}")
             return None
         finally:
-            # Clean up the temporary script
-            if os.path.exists(script_path):
-                os.remove(script_path)
+            # Don't leave a reserved temporary file behind for a failed or
+            # cancelled job
+            if reserved and not succeeded:
+                _remove_temp_blend(blender_project_path)
     
     def create_ideation_scene(
         self, 
         session_data: Dict, 
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        max_workers: Optional[int] = None
     ) -> Optional[str]:
         """
         Create a complete ideation scene in Blender with all the models
         from the ideation session.
         
+        Large models are imported in parallel Blender processes and then
+        appended into the scene.
+        
         Args:
             session_data: Dictionary containing paths to all models and metadata
             output_path: Path to save the resulting Blender file
+            max_workers: Maximum number of parallel imports.
+                If None, uses min(number of models, os.cpu_count()).
         
         Returns:
             Path to the created Blender project file
         """
-        if output_path is None:
-            # Create a file for the Blender project
-            temp_dir = tempfile.gettempdir()
-            output_path = os.path.join(temp_dir, f"ideation_scene_{int(time.time())}.blend")
+        return self.create_ideation_scene_async(session_data, output_path, max_workers).result()
+    
+    def create_ideation_scene_async(
+        self, 
+        session_data: Dict, 
+        output_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> BlenderJob:
+        """
+        Create an ideation scene without blocking the caller, so a UI stays
+        responsive and Blender work can overlap with other requests.
         
-        # Extract paths from session data
+        Args:
+            session_data: Dictionary containing paths to all models and metadata
+            output_path: Path to save the resulting Blender file
+            max_workers: Maximum number of parallel imports
+            on_progress: Optional callback receiving each line of Blender output
+                (called from a background thread)
+        
+        Returns:
+            Job resolving to the path of the created Blender project file;
+            cancel() stops it even while Blender is running
+        """
+        return _submit_job(
+            lambda job: self._create_ideation_scene(session_data, output_path, max_workers, job),
+            on_progress
+        )
+    
+    def _create_ideation_scene(
+        self, 
+        session_data: Dict, 
+        output_path: Optional[str], 
+        max_workers: Optional[int], 
+        job: BlenderJob
+    ) -> Optional[str]:
+        """Create an ideation scene as part of a job."""
+        # Extract paths from session data, dropping models that don't exist
+        # so Blender never has to check them
         sketch_3d_path = session_data.get('sketch_3d_path')
+        if sketch_3d_path and not os.path.exists(sketch_3d_path):
+            sketch_3d_path = None
         text_3d_path = session_data.get('text_3d_path')
+        if text_3d_path and not os.path.exists(text_3d_path):
+            text_3d_path = None
         title = session_data.get('title', 'Untitled')
         project_type = session_data.get('project_type', 'Unknown')
         genre = session_data.get('genre', 'Unknown')
         
-        # Create a Python script for Blender to execute
-        script_content = f"""
-import bpy
-import os
-import math
-
-# Clear default objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
-
-# Add metadata as text objects
-def add_text(text, location, size=1.0):
-    bpy.ops.object.text_add(location=location)
-    text_obj = bpy.context.active_object
-    text_obj.data.body = text
-    text_obj.data.size = size
-    return text_obj
-
-# Add scene metadata
-add_text("Concept: {title}", (0, 2, 0), 0.5)
-add_text("Project Type: {project_type}", (0, 1, 0), 0.5)
-add_text("Genre: {genre}", (0, 0, 0), 0.5)
-
-# Import models if they exist
-models = []
-
-# Function to import a 3D model
-def import_model(model_path, location):
-    if not model_path or not os.path.exists(model_path):
-        return None
+        # Import the models in parallel if they're big enough to be worth it
+        model_paths = [path for path in (sketch_3d_path, text_3d_path) if path]
+        partials = {}
+        if (
+            len(model_paths) > 1
+            and sum(os.path.getsize(path) for path in model_paths) >= PARALLEL_IMPORT_MIN_BYTES
+        ):
+            partials = self._import_partials(model_paths, max_workers, job)
         
-    file_extension = os.path.splitext(model_path)[1].lower()
-    
-    # Store current selection
-    selected_objs = [obj for obj in bpy.context.selected_objects]
-    active_obj = bpy.context.active_object
-    
-    # Import based on file extension
-    if file_extension == '.obj':
-        bpy.ops.import_scene.obj(filepath=model_path)
-    elif file_extension == '.fbx':
-        bpy.ops.import_scene.fbx(filepath=model_path)
-    elif file_extension == '.glb' or file_extension == '.gltf':
-        bpy.ops.import_scene.gltf(filepath=model_path)
-    elif file_extension == '.stl':
-        bpy.ops.import_mesh.stl(filepath=model_path)
-    elif file_extension == '.ply':
-        bpy.ops.import_mesh.ply(filepath=model_path)
-    elif file_extension == '.dae':
-        bpy.ops.wm.collada_import(filepath=model_path)
-    else:
-        print(f"Unsupported file format: {{file_extension}}")
-        return None
-    
-    # Get newly created objects
-    new_objs = [obj for obj in bpy.context.selected_objects if obj not in selected_objs]
-    
-    if new_objs:
-        # Group the new objects
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=location)
-        parent = bpy.context.active_object
-        parent.name = os.path.basename(model_path)
-        
-        for obj in new_objs:
-            obj.select_set(True)
-            parent.select_set(False)
-        
-        bpy.context.view_layer.objects.active = parent
-        bpy.ops.object.parent_set(type='OBJECT')
-        
-        # Move the group to the specified location
-        parent.location = location
-        return parent
-    
-    # Restore previous selection
-    for obj in bpy.context.selected_objects:
-        obj.select_set(False)
-    for obj in selected_objs:
-        obj.select_set(True)
-    if active_obj:
-        bpy.context.view_layer.objects.active = active_obj
-        
-    return None
-
-# Import the sketch-based 3D model
-if "{sketch_3d_path}":
-    sketch_model = import_model(r"{sketch_3d_path}", (-3, -3, 0))
-    if sketch_model:
-        add_text("From Sketch", (-3, -5, 0), 0.3)
-        models.append(sketch_model)
-
-# Import the text-based 3D model
-if "{text_3d_path}":
-    text_model = import_model(r"{text_3d_path}", (3, -3, 0))
-    if text_model:
-        add_text("From Description", (3, -5, 0), 0.3)
-        models.append(text_model)
-
-# Set up a simple studio lighting
-def create_studio_lighting():
-    # Create a new collection for lights
-    light_collection = bpy.data.collections.new("Studio Lighting")
-    bpy.context.scene.collection.children.link(light_collection)
-    
-    # Create three point lighting
-    key_light = bpy.data.lights.new(name="Key Light", type='AREA')
-    key_light.energy = 300
-    key_light_obj = bpy.data.objects.new(name="Key Light", object_data=key_light)
-    key_light_obj.location = (5, -5, 5)
-    key_light_obj.rotation_euler = (math.radians(45), 0, math.radians(45))
-    light_collection.objects.link(key_light_obj)
-    
-    fill_light = bpy.data.lights.new(name="Fill Light", type='AREA')
-    fill_light.energy = 150
-    fill_light_obj = bpy.data.objects.new(name="Fill Light", object_data=fill_light)
-    fill_light_obj.location = (-5, -2, 3)
-    fill_light_obj.rotation_euler = (math.radians(30), 0, math.radians(-45))
-    light_collection.objects.link(fill_light_obj)
-    
-    rim_light = bpy.data.lights.new(name="Rim Light", type='AREA')
-    rim_light.energy = 200
-    rim_light_obj = bpy.data.objects.new(name="Rim Light", object_data=rim_light)
-    rim_light_obj.location = (0, 5, 4)
-    rim_light_obj.rotation_euler = (math.radians(60), 0, math.radians(180))
-    light_collection.objects.link(rim_light_obj)
-
-create_studio_lighting()
-
-# Set up camera
-camera_data = bpy.data.cameras.new("Ideation Camera")
-camera_object = bpy.data.objects.new("Ideation Camera", camera_data)
-bpy.context.scene.collection.objects.link(camera_object)
-bpy.context.scene.camera = camera_object
-
-# Position camera to see all objects
-camera_object.location = (0, -10, 2)
-camera_object.rotation_euler = (math.radians(80), 0, 0)
-
-# Save the file
-bpy.ops.wm.save_as_mainfile(filepath=r"{output_path}")
-print(f"Ideation scene created and saved to {{output_path}}")
-"""
+        reserved = output_path is None
+        if reserved:
+            # Create a file for the Blender project
+            output_path = _temp_blend_path("ideation_scene_")
         
-        # Write the script to a temporary file
-        script_path = os.path.join(tempfile.gettempdir(), "create_ideation_scene.py")
-        with open(script_path, 'w') as f:
-            f.write(script_content)
+        params = {
+            "title": title,
+            "project_type": project_type,
+            "genre": genre,
+            "sketch_3d_path": sketch_3d_path,
+            "text_3d_path": text_3d_path,
+            "partials": partials,
+            "output_path": output_path,
+        }
         
         # Run Blender with the script
+        succeeded = False
         try:
-            subprocess.run([
-                self.blender_path,
-                "--background",
-                "--python", script_path
-            ], check=True)
+            self._run_script(_BUILD_SCENE_SCRIPT, params, job=job)
+            succeeded = not job.stopping
             
             print(f"Ideation scene created and saved to {output_path}")
             return output_path
             
-        except subprocess.CalledProcessError as e:
-            print(f"Error creating ideation scene: {e}")
+        except (subprocess.CalledProcessError, RuntimeError) as e:
+            print(f"Error creating ideation scene: {_describe_error(e)}")
             return None
         finally:
-            # Clean up the temporary script
-            if os.path.exists(script_path):
-                os.remove(script_path)
+            # Clean up the partial files, and the reserved temporary file if
+            # the job failed or was cancelled
+            for partial_path in partials.values():
+                os.remove(partial_path)
+            if reserved and not succeeded:
+                _remove_temp_blend(output_path)
 
     def launch_blender_with_scene(self, blend_file_path: str) -> bool:
         """
@@ -321,11 +693,22 @@ print(f"Ideation scene created and saved to {{output_path}}")
             print(f"Blend file not found: {blend_file_path}")
             return False
         
+        # Detach the GUI from this process: it shouldn't inherit our stdio or
+        # die with our process group (e.g. on Ctrl+C in the app's terminal)
+        if os.name == 'nt':
+            detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            detach = {"start_new_session": True}
+        
         try:
-            subprocess.Popen([
-                self.blender_path,
-                blend_file_path
-            ])
+            subprocess.Popen(
+                [self.blender_path, blend_file_path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                **detach
+            )
             return True
         except Exception as e:
             print(f"Error launching Blender: {e}")
@@ -8,7 +8,7 @@ from typing import List, Optional
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class IdeationSession:
     """Represents an ideation session for a Blender project."""
     
@@ -18,7 +18,9 @@ class IdeationSession:
     project_type: str = "Unknown"
     genre: str = "Unknown"
     description: str = ""
+    summary: str = ""
     tags: List[str] = field(default_factory=list)
+    suggestions: List[str] = field(default_factory=list)
     
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
@@ -39,7 +41,9 @@ class IdeationSession:
             "project_type": self.project_type,
             "genre": self.genre,
             "description": self.description,
+            "summary": self.summary,
             "tags": self.tags,
+            "suggestions": self.suggestions,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "sketch_path": self.sketch_path,
@@ -51,20 +55,22 @@ class IdeationSession:
     
     @classmethod
     def from_dict(cls, data: dict) -> "IdeationSession":
-        """Create a session from a dictionary."""
-        session_data = data.copy()
+        """
+        Create a session from a dictionary.
+        Keys that aren't session fields (e.g. from newer or older app
+        versions) are ignored.
+        """
+        session_data = {name: data[name] for name in cls.__dataclass_fields__ if name in data}
         
         # Convert string timestamps to datetime objects
-        if "created_at" in session_data and isinstance(session_data["created_at"], str):
-            session_data["created_at"] = datetime.fromisoformat(session_data["created_at"])
-        
-        if "updated_at" in session_data and isinstance(session_data["updated_at"], str):
-            session_data["updated_at"] = datetime.fromisoformat(session_data["updated_at"])
+        for key in ("created_at", "updated_at"):
+            if isinstance(session_data.get(key), str):
+                session_data[key] = datetime.fromisoformat(session_data[key])
         
         return cls(**session_data)
 
 
-@dataclass
+@dataclass(slots=True)
 class IdeationTag:
     """Represents a searchable tag for ideation sessions."""
     
@@ -81,7 +87,7 @@ class IdeationTag:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Application settings."""
     
@@ -0,0 +1,171 @@
+"""
+Blender script that builds an ideation scene from a session's models.
+
+Run inside Blender with:
+    blender --background --python build_scene.py -- --args JSON
+
+The JSON args hold "title", "project_type", "genre", "sketch_3d_path",
+"text_3d_path" and "output_path", plus "partials", which maps model paths to
+.blend files already imported by import_partial.py.
+"""
+
+import math
+import os
+import sys
+
+import bpy
+
+# Blender doesn't put the script's directory on sys.path. The worker runs
+# these scripts repeatedly in one process, so only add it once.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+from ideation_common import import_file, load_params, save_blend
+
+
+# Add metadata as text objects
+def add_text(text, location, size=1.0):
+    bpy.ops.object.text_add(location=location)
+    text_obj = bpy.context.active_object
+    text_obj.data.body = text
+    text_obj.data.size = size
+    return text_obj
+
+
+# Function to import a 3D model (the host only passes paths that exist)
+def import_model(model_path, location):
+    # Store current selection
+    selected_objs = [obj for obj in bpy.context.selected_objects]
+    active_obj = bpy.context.active_object
+    
+    if not import_file(model_path):
+        return None
+    
+    # Get newly created objects
+    new_objs = [obj for obj in bpy.context.selected_objects if obj not in selected_objs]
+    
+    if new_objs:
+        # Group the new objects
+        bpy.ops.object.empty_add(type='PLAIN_AXES', location=location)
+        parent = bpy.context.active_object
+        parent.name = os.path.basename(model_path)
+        
+        for obj in new_objs:
+            obj.select_set(True)
+            parent.select_set(False)
+        
+        bpy.context.view_layer.objects.active = parent
+        bpy.ops.object.parent_set(type='OBJECT')
+        
+        # Move the group to the specified location
+        parent.location = location
+        return parent
+    
+    # Restore previous selection
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
+    for obj in selected_objs:
+        obj.select_set(True)
+    if active_obj:
+        bpy.context.view_layer.objects.active = active_obj
+        
+    return None
+
+
+# Append a model group saved by import_partial.py
+def append_partial(blend_path, location):
+    with bpy.data.libraries.load(blend_path) as (data_from, data_to):
+        data_to.objects = data_from.objects
+    
+    parent = None
+    for obj in data_to.objects:
+        if obj is None:
+            continue
+        bpy.context.scene.collection.objects.link(obj)
+        if obj.parent is None:
+            parent = obj
+    
+    if parent:
+        parent.location = location
+    return parent
+
+
+# Three point studio lighting: name, energy, location, rotation in degrees
+STUDIO_LIGHTS = [
+    ("Key Light", 300, (5, -5, 5), (45, 0, 45)),
+    ("Fill Light", 150, (-5, -2, 3), (30, 0, -45)),
+    ("Rim Light", 200, (0, 5, 4), (60, 0, 180)),
+]
+
+
+# Set up a simple studio lighting
+def create_studio_lighting():
+    # Create a new collection for lights
+    light_collection = bpy.data.collections.new("Studio Lighting")
+    bpy.context.scene.collection.children.link(light_collection)
+    
+    for name, energy, location, rotation in STUDIO_LIGHTS:
+        light = bpy.data.lights.new(name=name, type='AREA')
+        light.energy = energy
+        light_obj = bpy.data.objects.new(name=name, object_data=light)
+        light_obj.location = location
+        light_obj.rotation_euler = tuple(math.radians(angle) for angle in rotation)
+        light_collection.objects.link(light_obj)
+
+
+def main():
+    params = load_params()
+    output_path = params["output_path"]
+    partials = params.get("partials", {})
+    
+    def place_model(model_path, location):
+        if model_path in partials:
+            return append_partial(partials[model_path], location)
+        return import_model(model_path, location)
+    
+    # Clear default objects
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    
+    # Add scene metadata
+    add_text(f"Concept: {params['title']}", (0, 2, 0), 0.5)
+    add_text(f"Project Type: {params['project_type']}", (0, 1, 0), 0.5)
+    add_text(f"Genre: {params['genre']}", (0, 0, 0), 0.5)
+    
+    # Import models if they exist
+    models = []
+    
+    # Import the sketch-based 3D model
+    if params.get("sketch_3d_path"):
+        sketch_model = place_model(params["sketch_3d_path"], (-3, -3, 0))
+        if sketch_model:
+            add_text("From Sketch", (-3, -5, 0), 0.3)
+            models.append(sketch_model)
+    
+    # Import the text-based 3D model
+    if params.get("text_3d_path"):
+        text_model = place_model(params["text_3d_path"], (3, -3, 0))
+        if text_model:
+            add_text("From Description", (3, -5, 0), 0.3)
+            models.append(text_model)
+    
+    create_studio_lighting()
+    
+    # Set up camera
+    camera_data = bpy.data.cameras.new("Ideation Camera")
+    camera_object = bpy.data.objects.new("Ideation Camera", camera_data)
+    bpy.context.scene.collection.objects.link(camera_object)
+    bpy.context.scene.camera = camera_object
+    
+    # Position camera to see all objects
+    camera_object.location = (0, -10, 2)
+    camera_object.rotation_euler = (math.radians(80), 0, 0)
+    
+    # Save the file
+    save_blend(output_path)
+    print(f"Ideation scene created and saved to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Helpers shared by the Blender scripts of the Blender Ideation Agent.
+"""
+
+import json
+import os
+import sys
+
+import bpy
+
+# Import operator for each supported model file extension
+IMPORTERS = {
+    '.obj': bpy.ops.import_scene.obj,
+    '.fbx': bpy.ops.import_scene.fbx,
+    '.glb': bpy.ops.import_scene.gltf,
+    '.gltf': bpy.ops.import_scene.gltf,
+    '.stl': bpy.ops.import_mesh.stl,
+    '.ply': bpy.ops.import_mesh.ply,
+    '.dae': bpy.ops.wm.collada_import,
+}
+
+
+def load_params():
+    """Parse the JSON parameters passed after the `--` separator in sys.argv."""
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    return json.loads(argv[argv.index("--args") + 1])
+
+
+def import_file(model_path):
+    """Import a model file with the operator for its extension."""
+    file_extension = os.path.splitext(model_path)[1].lower()
+    importer = IMPORTERS.get(file_extension)
+    if importer is None:
+        print(f"Unsupported file format: {file_extension}")
+        return False
+    importer(filepath=model_path)
+    return True
+
+
+def save_blend(output_path):
+    """Save the scene, replacing an empty placeholder file without a backup."""
+    # The host reserves temporary output names with empty files; saving over
+    # one would otherwise keep it as a useless .blend1 backup
+    if os.path.exists(output_path) and os.path.getsize(output_path) == 0:
+        os.remove(output_path)
+    bpy.ops.wm.save_as_mainfile(filepath=output_path)
@@ -0,0 +1,39 @@
+"""
+Blender script that imports a single 3D model into an empty scene and saves it.
+
+Run inside Blender with:
+    blender --background --python import_model.py -- --args JSON
+
+The JSON args hold "model_path" and "output_path".
+"""
+
+import os
+import sys
+
+import bpy
+
+# Blender doesn't put the script's directory on sys.path. The worker runs
+# these scripts repeatedly in one process, so only add it once.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+from ideation_common import import_file, load_params, save_blend
+
+
+def main():
+    params = load_params()
+    
+    # Clear default objects
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    
+    # Import the 3D model
+    import_file(params["model_path"])
+    
+    # Save the file
+    save_blend(params["output_path"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Blender script that imports one model, grouped under an empty at the origin,
+into a partial .blend file for build_scene.py to append.
+
+Run inside Blender with:
+    blender --background --python import_partial.py -- --args JSON
+
+The JSON args hold "model_path" and "output_path".
+"""
+
+import os
+import sys
+
+import bpy
+
+# Blender doesn't put the script's directory on sys.path. The worker runs
+# these scripts repeatedly in one process, so only add it once.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+from build_scene import import_model
+from ideation_common import load_params, save_blend
+
+
+def main():
+    params = load_params()
+    
+    # Clear default objects
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    
+    import_model(params["model_path"], (0, 0, 0))
+    
+    # Save the file
+    save_blend(params["output_path"])
+
+
+if __name__ == "__main__":
+    main()
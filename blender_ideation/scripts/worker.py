@@ -0,0 +1,85 @@
+"""
+Persistent Blender worker for the Blender Ideation Agent.
+
+Run inside Blender with `blender --background --python worker.py`. Reads one
+JSON command per line from stdin and answers each with one JSON reply line on
+stdout, prefixed with REPLY_PREFIX so replies can be told apart from
+Blender's own console output. Exits when stdin is closed.
+"""
+
+import json
+import os
+import sys
+import traceback
+
+import bpy
+
+REPLY_PREFIX = "@@blender_ideation@@ "
+
+# Compiled scripts, keyed by path, with the mtime they were compiled at
+_code_cache = {}
+
+
+def load_code(script_path):
+    """Compile a script, reusing the compiled code while the file is unchanged."""
+    mtime = os.stat(script_path).st_mtime_ns
+    cached = _code_cache.get(script_path)
+    if cached is None or cached[0] != mtime:
+        with open(script_path, 'r') as f:
+            cached = (mtime, compile(f.read(), script_path, 'exec'))
+        _code_cache[script_path] = cached
+    return cached[1]
+
+
+def run_script(command):
+    """Run a script file in a fresh, empty scene."""
+    # Start every job from the user's startup file without its objects, so
+    # jobs can't leak scene state into each other
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+    script_path = command["script"]
+    code = load_code(script_path)
+
+    # Scripts read their arguments after `--`, as on the command line
+    saved_argv = sys.argv
+    sys.argv = [sys.argv[0], "--"] + command.get("argv", [])
+    try:
+        exec(code, {"__name__": "__main__", "__file__": script_path})
+    finally:
+        sys.argv = saved_argv
+    return {}
+
+
+def ping(command):
+    """Check that the worker is responsive."""
+    return {}
+
+
+HANDLERS = {
+    "run_script": run_script,
+    "ping": ping,
+}
+
+
+def reply(message):
+    """Write a reply line and flush it to the host."""
+    sys.stdout.write(REPLY_PREFIX + json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def main():
+    """Serve commands until stdin is closed."""
+    # The host decodes output as UTF-8, whatever the platform's locale
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            command = json.loads(line)
+            result = HANDLERS[command["op"]](command)
+            reply({"ok": True, **result})
+        except Exception:
+            reply({"ok": False, "error": traceback.format_exc()})
+
+
+main()
@@ -2,15 +2,42 @@
 Utility functions for the Blender Ideation Agent.
 """
 
-import json
+from __future__ import annotations
+
+import glob
+import io
 import os
+import re
+import shutil
 import tempfile
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import numpy as np
-from PIL import Image
+# orjson is much faster for session files; fall back to the standard library
+# where it isn't installed
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+
+# PIL is imported where it is used, so the Blender and session helpers
+# don't pay for loading it
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 def ensure_directory(directory_path: str) -> str:
@@ -55,8 +82,15 @@ def save_image(image: Image.Image, directory: str, filename: Optional[str] = Non
     # Construct the full path
     filepath = os.path.join(directory, filename)
     
-    # Save the image
-    image.save(filepath)
+    # Encode in memory and write the file in one call; PNGs use fast, light
+    # compression since ideation images are short-lived working files
+    buffer = io.BytesIO()
+    if filename.lower().endswith('.png'):
+        image.save(buffer, format='PNG', compress_level=1)
+    else:
+        image.save(buffer, format='JPEG')
+    with open(filepath, 'wb') as f:
+        f.write(buffer.getbuffer())
     
     return filepath
 
@@ -71,6 +105,8 @@ def load_image(filepath: str) -> Optional[Image.Image]:
     Returns:
         PIL Image object, or None if loading fails
     """
+    from PIL import Image
+    
     try:
         return Image.open(filepath)
     except Exception as e:
@@ -78,47 +114,51 @@ def load_image(filepath: str) -> Optional[Image.Image]:
         return None
 
 
-def add_color_tint(image: Image.Image, color: Tuple[int, int, int], intensity: float = 0.3) -> Image.Image:
-    """
-    Add a color tint to an image.
-    
-    Args:
-        image: PIL Image object
-        color: RGB tuple (0-255 for each channel)
-        intensity: How strong the tint should be (0.0-1.0)
-        
-    Returns:
-        New image with color tint applied
-    """
-    # Convert to RGBA if not already
-    if image.mode != 'RGBA':
-        image = image.convert('RGBA')
-    
-    # Create a solid color image with the same size
-    tint = Image.new('RGBA', image.size, (*color, int(255 * intensity)))
-    
-    # Composite the images
-    return Image.alpha_composite(image, tint)
+def _version_key(path: str) -> Tuple[int, ...]:
+    """Sort key ordering install paths like '.../Blender 4.10/...' by version number."""
+    return tuple(int(part) for part in re.findall(r"\d+", path))
+
+
+# Blender executable found by an earlier search
+_blender_executable: Optional[str] = None
 
 
 def find_blender_executable() -> Optional[str]:
     """
     Find the Blender executable on the system.
+    A found executable is remembered for later calls; if none is found, the
+    next call searches again, so a Blender installed (or added to the PATH)
+    while the app is running is picked up.
     
     Returns:
         Path to Blender executable if found, None otherwise
     """
+    global _blender_executable
+    if _blender_executable is None:
+        _blender_executable = _search_blender_executable()
+    return _blender_executable
+
+
+def _search_blender_executable() -> Optional[str]:
+    """Search the PATH and common install locations for Blender."""
+    # Blender on the PATH takes precedence
+    on_path = shutil.which("blender")
+    if on_path:
+        return on_path
+    
+    # Newest Windows install of any version
+    windows_installs = glob.glob(r"C:\Program Files\Blender Foundation\Blender *\blender.exe")
+    if windows_installs:
+        return max(windows_installs, key=_version_key)
+    
     # Common locations for Blender
     possible_locations = [
-        # Windows
-        r"C:\Program Files\Blender Foundation\Blender 4.1\blender.exe",
-        r"C:\Program Files\Blender Foundation\Blender 4.0\blender.exe",
-        r"C:\Program Files\Blender Foundation\Blender 3.6\blender.exe",
         # macOS
         "/Applications/Blender.app/Contents/MacOS/Blender",
         # Linux
         "/usr/bin/blender",
         "/usr/local/bin/blender",
+        "/snap/bin/blender",
     ]
     
     for location in possible_locations:
@@ -154,8 +194,17 @@ def save_session_to_json(session: Dict, filepath: str) -> bool:
         True if saved successfully, False otherwise
     """
     try:
-        with open(filepath, 'w') as f:
-            json.dump(session, f, indent=2)
+        # Write to a temporary file first, so a reader or an overlapping save
+        # never sees a partially written session
+        tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(session))
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         return True
     except Exception as e:
         print(f"Error saving session to {filepath}: {e}")
@@ -173,13 +222,21 @@ def load_session_from_json(filepath: str) -> Optional[Dict]:
         Session dictionary if loaded successfully, None otherwise
     """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        # Read the whole file in one call and parse the bytes directly
+        with open(filepath, 'rb') as f:
+            return _loads(f.read())
     except Exception as e:
         print(f"Error loading session from {filepath}: {e}")
         return None
 
 
+# Runs of three or more characters between whitespace and common separators
+_TAG_WORD_RE = re.compile(r"[^\s,;.]{3,}")
+
+# Common words that make poor tags
+_STOP_WORDS = frozenset({'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 'of'})
+
+
 def extract_tags_from_text(text: str) -> List[str]:
     """
     Extract potential tags from text using simple heuristics.
@@ -191,12 +248,6 @@ def extract_tags_from_text(text: str) -> List[str]:
     Returns:
         List of potential tags
     """
-    # Convert to lowercase and split by common separators
-    words = text.lower().replace(',', ' ').replace(';', ' ').replace('.', ' ').split()
-    
-    # Filter out common stop words and short words
-    stop_words = {'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 'of'}
-    potential_tags = [word for word in words if word not in stop_words and len(word) > 2]
-    
-    # Deduplicate
-    return list(set(potential_tags))
\ No newline at end of file
+    # Split by whitespace and common separators, keeping words longer than
+    # two characters, then deduplicate and drop stop words
+    return list(set(_TAG_WORD_RE.findall(text.lower())) - _STOP_WORDS)
\ No newline at end of file